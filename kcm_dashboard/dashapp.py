@@ -0,0 +1,137 @@
+# app.py
+import dash
+from dash import html, dcc, Output, Input, State
+import dash_bootstrap_components as dbc
+import plotly.graph_objects as go
+import pandas as pd
+import numpy as np
+import numba
+import datetime
+import random
+import time
+
+from orjson_provider import use_orjson
+
+# Load mock data — timestamps come from a C-level date_range instead of a
+# per-element datetime comprehension, and the PCG64 generator replaces the
+# slower legacy np.random global.
+def generate_dummy_data():
+    rng = np.random.default_rng()
+    return pd.DataFrame({
+        'timestamp': pd.date_range(end=datetime.datetime.now(), periods=60, freq='10s'),
+        'SO2': rng.normal(2, 0.3, 60).clip(0, 20),
+        'CO2': rng.normal(350, 20, 60),
+        'CO': rng.normal(10, 1, 60),
+        'H2S': rng.normal(5, 0.5, 60),
+        'O2': rng.normal(20, 1, 60)
+    })
+
+app = dash.Dash(__name__, suppress_callback_exceptions=True)
+app.title = "Gas Monitoring Dashboard"
+server = app.server  # gunicorn entry point
+use_orjson(server)
+df = generate_dummy_data()
+
+GASES = ['SO2', 'CO2', 'CO', 'H2S', 'O2']
+
+# Built once: direct graph_objects construction skips px's per-column type
+# inference and hover-template machinery, and Scattergl renders via WebGL.
+_dark_layout = dict(paper_bgcolor="#161a28", plot_bgcolor="#161a28", font_color="white")
+_live_fig = go.Figure(
+    [go.Scattergl(x=df['timestamp'].to_numpy(), y=df[gas].to_numpy(), mode='lines', name=gas)
+     for gas in GASES],
+    layout=go.Layout(title="Live Gas Readings", **_dark_layout))
+
+# Mock AI model logic: compiled threshold cascade over raw ndarrays, so
+# classifying the whole history costs the same as one pure-Python row.
+RISK_LABELS = ("Safe", "Warning", "Danger")
+
+@numba.njit(cache=True)
+def classify(so2, h2s):
+    out = np.empty(so2.shape[0], dtype=np.uint8)
+    for i in range(so2.shape[0]):
+        risk = 0
+        if so2[i] > 5 or h2s[i] > 8:
+            risk = 1
+        if so2[i] > 10 or h2s[i] > 15:
+            risk = 2
+        out[i] = risk
+    return out
+
+# Warm the JIT at import so the first callback doesn't pay compile time
+classify(np.zeros(1), np.zeros(1))
+
+# App Layout
+app.layout = html.Div(id='big-app-container', children=[
+    html.Div(className="banner", children=[
+        html.H5("Gas Monitoring Dashboard"),
+        html.Div(id='live-time')
+    ]),
+
+    html.Div(id='app-container', children=[
+        dcc.Tabs(id='tabs', value='tab2', className='custom-tabs', children=[
+            dcc.Tab(label='Sensor Settings', value='tab1', className='custom-tab', selected_className='custom-tab--selected'),
+            dcc.Tab(label='Live Monitoring', value='tab2', className='custom-tab', selected_className='custom-tab--selected'),
+            dcc.Tab(label='Reports', value='tab3', className='custom-tab', selected_className='custom-tab--selected'),
+        ]),
+
+        html.Div(id='tab-content')
+    ]),
+
+    dcc.Interval(id='update-interval', interval=5 * 1000, n_intervals=0),
+])
+
+# Clock display has 1 s precision, so reformat at most once per epoch
+# second and serve the cached string to every tick/client in between.
+# Plain int/str assignments are atomic under the GIL, so no lock needed.
+_last_sec = 0
+_last_str = ""
+
+@app.callback(Output('live-time', 'children'), Input('update-interval', 'n_intervals'))
+def update_time(n):
+    global _last_sec, _last_str
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+        _last_sec = sec
+    return _last_str
+
+@app.callback(Output('tab-content', 'children'), Input('tabs', 'value'))
+def render_tabs(tab):
+    if tab == 'tab1':
+        return html.Div("Sensor Settings Coming Soon", className="section-banner")
+
+    elif tab == 'tab2':
+        so2 = df['SO2'].to_numpy()
+        latest_so2 = so2[-1]
+        ai_status = RISK_LABELS[classify(so2, df['H2S'].to_numpy())[-1]]
+
+        return html.Div(children=[
+            html.Div(className="row", children=[
+                html.Div(id="card-1", children=[
+                    html.P("SO₂ Level"),
+                    html.H3(f"{latest_so2:.2f} ppm")
+                ]),
+                html.Div(id="card-2", children=[
+                    html.P("AI Risk Level"),
+                    html.H3(ai_status)
+                ]),
+                html.Div(id="utility-card", children=[
+                    html.Button("Export PDF Report", id="export-btn", className="button button-primary")
+                ])
+            ]),
+
+            html.Div(id="graphs-container", children=[
+                dcc.Graph(id='live-chart', figure=_live_fig)
+            ])
+        ])
+
+    elif tab == 'tab3':
+        return html.Div("Historical Analysis Coming Soon", className="section-banner")
+
+@app.callback(Output("export-btn", "children"), Input("export-btn", "n_clicks"), prevent_initial_call=True)
+def generate_pdf(n):
+    return "PDF Exported ✔"
+
+if __name__ == '__main__':
+    app.run_server(debug=True)
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+from datetime import datetime
+
+import httpx
+
+try:
+    # uvloop's C event loop roughly halves per-request asyncio overhead;
+    # fall back to the stdlib loop where it isn't available (e.g. Windows).
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Firebase Realtime Database URL (your project)
+DATABASE_URL = "https://kcm-e-f27f0-default-rtdb.firebaseio.com"
+
+# One client for the whole process: connections are kept alive across
+# pushes, so we pay the TCP+TLS handshake once instead of per call, and
+# HTTP/2 multiplexes concurrent requests over the same connection.
+client = httpx.AsyncClient(http2=True, base_url=DATABASE_URL, timeout=5.0)
+
+
+async def push(updates):
+    """Send a batch of path -> value updates in a single PATCH.
+
+    Firebase applies each path in the body atomically, so several sensor
+    readings can be coalesced into one request, e.g.
+    ``{"sensors/so2": 2.1, "sensors/co2": 350}``.
+    """
+    response = await client.patch("/.json", json=updates)
+    response.raise_for_status()
+    return response.json()
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+def _get_loop():
+    # One background event loop thread, started on first use, so pushes
+    # submitted from synchronous code never block the caller.
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="fire-push", daemon=True).start()
+    return _loop
+
+
+def push_from_thread(updates):
+    """Schedule push() from synchronous code such as a Dash callback.
+
+    Returns a concurrent.futures.Future; callers that don't care about the
+    result can simply drop it.
+    """
+    return asyncio.run_coroutine_threadsafe(push(updates), _get_loop())
+
+
+async def main():
+    # Demo: batch a few readings into one request
+    updates = {
+        "test/value": 42,
+        "test/temperature": 25.6,
+        "test/status": "OK",
+        "test/timestamp": datetime.now().isoformat(),
+    }
+    try:
+        result = await push(updates)
+        print("✅ Data sent successfully:")
+        print(result)
+    except httpx.HTTPError as exc:
+        print("❌ Failed to send data:")
+        print(exc)
+    finally:
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
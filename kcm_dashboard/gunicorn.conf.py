@@ -0,0 +1,23 @@
+# Production server config: the callbacks here are small and I/O-bound
+# (Firebase pushes, JSON responses), so gevent greenlets interleave them
+# instead of serializing every Interval tick through one Werkzeug thread.
+#
+# workers = 4 is safe for the apps whose callback state is read-only or
+# lives client-side, e.g.:
+#   gunicorn -c gunicorn.conf.py app:server
+#   gunicorn -c gunicorn.conf.py so_2_monitoring_dashboard:server
+#   gunicorn -c gunicorn.conf.py dashapp:server
+# (dashapp's only mutable global is the clock-string cache, which each
+# worker recomputes from the wall clock.) test1, test2 and test3 mutate
+# sensor_limits — and test3 its live window / LatestReading, test2 its
+# base figure — in per-process module globals, so with several workers an
+# Update Settings click changes one worker while the rest keep serving
+# stale thresholds, and test3's workers each simulate their own series.
+# Run those with a single worker:
+#   gunicorn -c gunicorn.conf.py -w 1 test3:server
+# or move that state to a shared store (e.g. Redis) before scaling out.
+bind = "0.0.0.0:8050"
+workers = 4
+worker_class = "gevent"
+worker_connections = 1000
+keepalive = 65
@@ -0,0 +1,20 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Dash serializes every callback response through the Flask server's JSON
+# provider. orjson handles numpy scalars/arrays and datetimes natively, so
+# figures skip the reflect-each-value-into-Python step of stdlib json.
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=_OPTIONS, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def use_orjson(server):
+    """Install the orjson provider on a Flask server (use_orjson(app.server))."""
+    server.json = ORJSONProvider(server)
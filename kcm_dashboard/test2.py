@@ -0,0 +1,222 @@
+import os
+import functools
+import pandas as pd
+import dash
+import diskcache
+from dash import html, dcc, Input, Output, State, Patch, DiskcacheManager, callback_context
+import dash_daq as daq
+import plotly.graph_objs as go
+import dash_bootstrap_components as dbc
+from reportlab.pdfgen import canvas
+from io import BytesIO
+
+from orjson_provider import use_orjson
+
+# Background callbacks run on a diskcache job queue so the PDF export
+# doesn't hold the Flask worker (swap in CeleryManager + Redis for prod).
+# Kept out of ./cache: Flask-Caching's FileSystemCache prunes that
+# directory and would delete diskcache's files.
+background_callback_manager = DiskcacheManager(diskcache.Cache("./diskcache"))
+
+app = dash.Dash(__name__, external_stylesheets=[dbc.themes.CYBORG],
+                background_callback_manager=background_callback_manager)
+app.title = "SO₂ Gas Monitoring Dashboard"
+server = app.server
+use_orjson(server)
+
+# Mock Data Initialization
+df = pd.DataFrame({
+    "Time": pd.date_range(start="2025-01-01", periods=100, freq="T"),
+    "SO2": [500 + i % 100 for i in range(100)],
+})
+
+# Sensor Threshold Defaults
+sensor_limits = {
+    "SO2": {"lsl": 300, "usl": 800, "lcl": 400, "ucl": 700}
+}
+
+# Tab Layouts
+
+def sensor_settings_tab():
+    return dbc.Card([
+        dbc.CardHeader("Sensor Settings"),
+        dbc.CardBody([
+            html.Label("SO₂ Thresholds"),
+            dbc.Row([
+                dbc.Col(daq.NumericInput(id="lsl", label="LSL", value=sensor_limits["SO2"]["lsl"])),
+                dbc.Col(daq.NumericInput(id="lcl", label="LCL", value=sensor_limits["SO2"]["lcl"])),
+                dbc.Col(daq.NumericInput(id="ucl", label="UCL", value=sensor_limits["SO2"]["ucl"])),
+                dbc.Col(daq.NumericInput(id="usl", label="USL", value=sensor_limits["SO2"]["usl"])),
+            ]),
+            html.Br(),
+            dbc.Button("Update Settings", id="update-settings", color="info"),
+        ])
+    ])
+
+def _make_base_figure():
+    # Full figure built once at import (the data here is static) and again
+    # only when the thresholds change; tab opens reuse it as-is and the
+    # callback below only patches the threshold lines.
+    limits = sensor_limits["SO2"]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=df["Time"], y=df["SO2"], mode="lines+markers", name="SO₂"))
+    fig.add_hline(y=limits["usl"], line_dash="dot", line_color="red", annotation_text="USL")
+    fig.add_hline(y=limits["lsl"], line_dash="dot", line_color="blue", annotation_text="LSL")
+    fig.add_hline(y=limits["ucl"], line_dash="dash", line_color="orange", annotation_text="UCL")
+    fig.add_hline(y=limits["lcl"], line_dash="dash", line_color="lightblue", annotation_text="LCL")
+    fig.update_layout(title="Live SO₂ Chart", paper_bgcolor="black", font={"color": "white"})
+    return fig
+
+_BASE_FIG = _make_base_figure()
+
+def live_chart_tab():
+    return dbc.Card([
+        dbc.CardHeader("Live SO₂ Chart & AI Panel"),
+        dbc.CardBody([
+            dbc.Row([
+                dbc.Col([
+                    dcc.Graph(id="live-chart", figure=_BASE_FIG)
+                ], width=9),
+                dbc.Col([
+                    html.H5("AI Model Prediction"),
+                    html.Div(id="ai-status", style={"fontSize": 28, "color": "lime"}),
+                    html.Br(),
+                    daq.Indicator(id="ai-indicator", color="green", value=True),
+                    html.Br(),
+                    dbc.Button("Run AI Prediction", id="run-ai", color="primary"),
+                ], width=3)
+            ])
+        ])
+    ])
+
+@functools.lru_cache(maxsize=4)
+def _history_figure(key):
+    # key is (row count, last timestamp), so repeat tab switches reuse the
+    # cached figure instead of rescanning the history.
+    return go.Figure(
+        data=[go.Scattergl(x=df["Time"].values, y=df["SO2"].values, mode="lines")],
+        layout=go.Layout(title="SO₂ Historical Data", paper_bgcolor="black", font={"color": "white"})
+    )
+
+def history_tab():
+    return dbc.Card([
+        dbc.CardHeader("Historical Trends and Report"),
+        dbc.CardBody([
+            dcc.Graph(id="history-chart",
+                      figure=_history_figure((len(df), df["Time"].iloc[-1].value))),
+            dbc.Button("Export PDF Report", id="export-pdf", color="warning"),
+            dcc.Download(id="download-pdf")
+        ])
+    ])
+
+# App Layout
+app.layout = dbc.Container([
+    html.H2("SO₂ Gas Monitoring Dashboard", className="text-center my-4"),
+    dcc.Tabs(id="tabs", value="settings", children=[
+        dcc.Tab(label="Sensor Settings", value="settings"),
+        dcc.Tab(label="Live Control Chart", value="live"),
+        dcc.Tab(label="Historical Trends", value="history"),
+    ], className="mb-3"),
+    html.Div(id="tab-content")
+], fluid=True)
+
+# Tab Switcher
+@app.callback(Output("tab-content", "children"), Input("tabs", "value"))
+def switch_tabs(tab):
+    if tab == "settings":
+        return sensor_settings_tab()
+    elif tab == "live":
+        return live_chart_tab()
+    elif tab == "history":
+        return history_tab()
+
+# Update Sensor Settings
+@app.callback(
+    Output("lsl", "value"), Output("lcl", "value"),
+    Output("ucl", "value"), Output("usl", "value"),
+    Input("update-settings", "n_clicks"),
+    State("lsl", "value"), State("lcl", "value"),
+    State("ucl", "value"), State("usl", "value")
+)
+def update_settings(n, lsl, lcl, ucl, usl):
+    global _BASE_FIG
+    if n:
+        sensor_limits["SO2"] = {"lsl": lsl, "lcl": lcl, "ucl": ucl, "usl": usl}
+        _BASE_FIG = _make_base_figure()
+    return lsl, lcl, ucl, usl
+
+# Run Mock AI Prediction
+@app.callback(
+    Output("ai-status", "children"),
+    Output("ai-indicator", "color"),
+    Output("ai-indicator", "value"),
+    Input("run-ai", "n_clicks")
+)
+def run_ai_model(n):
+    if n:
+        latest_value = df["SO2"].iloc[-1]
+        if latest_value > sensor_limits["SO2"]["usl"]:
+            return "DANGER", "red", True
+        elif latest_value > sensor_limits["SO2"]["ucl"]:
+            return "WARNING", "orange", True
+        else:
+            return "SAFE", "green", True
+    return "", "green", False
+
+# Live Chart
+@app.callback(
+    Output("live-chart", "figure"), Input("run-ai", "n_clicks"),
+    prevent_initial_call=True
+)
+def update_live_chart(n):
+    # The data never changes here, so patch only the four threshold lines
+    # (added in usl/lsl/ucl/lcl order by _make_base_figure) instead of
+    # re-sending the whole figure.
+    limits = sensor_limits["SO2"]
+    patch = Patch()
+    for i, key in enumerate(("usl", "lsl", "ucl", "lcl")):
+        patch["layout"]["shapes"][i]["y0"] = limits[key]
+        patch["layout"]["shapes"][i]["y1"] = limits[key]
+        patch["layout"]["annotations"][i]["y"] = limits[key]
+    return patch
+
+# Export PDF Report
+@app.callback(
+    Output("download-pdf", "data"),
+    Input("export-pdf", "n_clicks"),
+    background=True,
+    running=[(Output("export-pdf", "disabled"), True, False)],
+    prevent_initial_call=True
+)
+def export_pdf(n):
+    if n:
+        limits = sensor_limits["SO2"]
+        summary = df["SO2"].describe()
+        alerts = int((df["SO2"] > limits["usl"]).sum())
+
+        # The report is a handful of static text lines, so draw them
+        # directly instead of running an HTML+CSS layout engine, and keep
+        # the PDF in memory instead of a tempfile round-trip.
+        buf = BytesIO()
+        pdf = canvas.Canvas(buf)
+        pdf.setFont("Helvetica-Bold", 16)
+        pdf.drawString(72, 770, "SO₂ Monitoring Report")
+        pdf.setFont("Helvetica", 12)
+        y = 740
+        for line in (
+            f"LSL: {limits['lsl']}",
+            f"LCL: {limits['lcl']}",
+            f"UCL: {limits['ucl']}",
+            f"USL: {limits['usl']}",
+            f"Mean: {summary['mean']:.2f}",
+            f"Min: {summary['min']:.2f}",
+            f"Max: {summary['max']:.2f}",
+            f"Readings above USL: {alerts}",
+        ):
+            pdf.drawString(72, y, line)
+            y -= 20
+        pdf.save()
+        return dcc.send_bytes(buf.getvalue(), "so2_report.pdf")
+
+if __name__ == "__main__":
+    app.run_server(debug=True, port=8050)
@@ -0,0 +1,246 @@
+import os
+import functools
+import numpy as np
+import random
+from collections import deque
+from datetime import datetime, timedelta
+
+import dash
+from dash import html, dcc, Input, Output, State
+import dash_daq as daq
+import plotly.graph_objs as go
+import plotly.io as pio
+import dash_bootstrap_components as dbc
+from flask_caching import Cache
+
+from orjson_provider import use_orjson
+
+# orjson serializes figures (numpy arrays, datetimes) several times faster
+# than stdlib json
+pio.json.config.default_engine = "orjson"
+
+app = dash.Dash(__name__, external_stylesheets=[dbc.themes.CYBORG])
+app.title = "SO₂ Gas Monitoring Dashboard"
+server = app.server
+use_orjson(server)
+
+cache = Cache(server, config={"CACHE_TYPE": "FileSystemCache", "CACHE_DIR": "cache"})
+
+# Generate initial mock data into a bounded deque of (time, so2) tuples.
+# Appends on a maxlen deque are atomic under the GIL, so concurrent interval
+# fires from threads within one server process can't tear the buffer, and
+# there is still no per-tick DataFrame allocation. This does NOT cover
+# multiple gunicorn workers — each process gets its own deque, so run this
+# app single-worker (see gunicorn.conf.py).
+WINDOW = 100
+_start_time = datetime.now() - timedelta(minutes=WINDOW)
+_buf = deque(
+    ((_start_time + timedelta(minutes=i), float(500 + random.randint(-50, 50)))
+     for i in range(WINDOW)),
+    maxlen=WINDOW)
+
+def buffer_view():
+    # Oldest-to-newest snapshot of the buffer, for plotting
+    times, so2 = zip(*_buf)
+    return times, so2
+
+def latest_so2():
+    return _buf[-1][1]
+
+# Sensor Threshold Defaults
+sensor_limits = {
+    "SO2": {"lsl": 300, "usl": 800, "lcl": 400, "ucl": 700}
+}
+
+# Branchless risk classification: a 65536-entry value -> code table built
+# lazily per thresholds tuple, so the per-tick check is one memory load with
+# no compare chain to mispredict. Thresholds only change on user action, so
+# the lru_cache rebuild is essentially free.
+AI_STATUS = ("SAFE", "WARNING", "DANGER")
+AI_COLOR = ("green", "orange", "red")
+
+@functools.lru_cache(maxsize=4)
+def _risk_lut(ucl, usl):
+    lut = np.zeros(65536, dtype=np.uint8)
+    lut[min(int(ucl) + 1, 65535):] = 1
+    lut[min(int(usl) + 1, 65535):] = 2
+    return lut
+
+def classify_value(value):
+    limits = sensor_limits["SO2"]
+    lut = _risk_lut(limits["ucl"], limits["usl"])
+    return int(lut[min(max(int(round(value)), 0), 65535)])
+
+# Latest classified sample, computed once per tick and shared with tab
+# renders so a freshly opened live tab shows data immediately instead of
+# waiting for the next interval.
+class LatestReading:
+    so2 = 0.0
+    status = ""
+    color = "green"
+
+def refresh_latest():
+    value = latest_so2()
+    code = classify_value(value)
+    LatestReading.so2 = value
+    LatestReading.status = AI_STATUS[code]
+    LatestReading.color = AI_COLOR[code]
+
+refresh_latest()
+
+# Tab Layouts
+
+def sensor_settings_tab():
+    return dbc.Card([
+        dbc.CardHeader("Sensor Settings"),
+        dbc.CardBody([
+            html.Label("SO₂ Thresholds"),
+            dbc.Row([
+                dbc.Col(daq.NumericInput(id="lsl", label="LSL", value=sensor_limits["SO2"]["lsl"])),
+                dbc.Col(daq.NumericInput(id="lcl", label="LCL", value=sensor_limits["SO2"]["lcl"])),
+                dbc.Col(daq.NumericInput(id="ucl", label="UCL", value=sensor_limits["SO2"]["ucl"])),
+                dbc.Col(daq.NumericInput(id="usl", label="USL", value=sensor_limits["SO2"]["usl"])),
+            ]),
+            html.Br(),
+            dbc.Button("Update Settings", id="update-settings", color="info"),
+        ])
+    ])
+
+def _make_base_figure():
+    # Static scaffolding: empty trace, threshold lines and layout. Built
+    # once at import and again only when the thresholds change.
+    limits = sensor_limits["SO2"]
+    fig = go.Figure(data=[go.Scatter(x=[], y=[], mode="lines+markers", name="SO₂")])
+    fig.add_hline(y=limits["usl"], line_dash="dot", line_color="red", annotation_text="USL")
+    fig.add_hline(y=limits["lsl"], line_dash="dot", line_color="blue", annotation_text="LSL")
+    fig.add_hline(y=limits["ucl"], line_dash="dash", line_color="orange", annotation_text="UCL")
+    fig.add_hline(y=limits["lcl"], line_dash="dash", line_color="lightblue", annotation_text="LCL")
+    fig.update_layout(title="Live SO₂ Chart", paper_bgcolor="black", font={"color": "white"}, template="plotly_dark")
+    return fig
+
+_BASE_FIG = _make_base_figure()
+
+@cache.memoize(timeout=5)
+def _live_chart_figure(key):
+    # key is (buffer fill, last timestamp, thresholds) so tab switches
+    # within one interval tick hit the cache instead of rebuilding and
+    # re-serializing, while a settings change invalidates immediately
+    # (the figure embeds the threshold lines via _BASE_FIG).
+    times, so2 = buffer_view()
+    fig = go.Figure(_BASE_FIG)
+    fig.data[0].x = times
+    fig.data[0].y = so2
+    return fig
+
+def live_chart_figure():
+    limits = sensor_limits["SO2"]
+    return _live_chart_figure((len(_buf), _buf[-1][0],
+                               limits["lsl"], limits["lcl"], limits["ucl"], limits["usl"]))
+
+def live_chart_tab():
+    return dbc.Card([
+        dbc.CardHeader("Live SO₂ Chart & AI Panel"),
+        dbc.CardBody([
+            dbc.Row([
+                dbc.Col([
+                    dcc.Graph(id="live-chart", figure=live_chart_figure())
+                ], width=9),
+                dbc.Col([
+                    html.H5("SO₂ Level (ppm)"),
+                    html.H3(f"{LatestReading.so2:.1f} ppm", id="current-so2", style={"color": "cyan"}),
+                    html.H5("AI Model Prediction"),
+                    html.Div(LatestReading.status, id="ai-status", style={"fontSize": 28, "color": "lime"}),
+                    html.Br(),
+                    daq.Indicator(id="ai-indicator", color=LatestReading.color, value=True),
+                    html.Br(),
+                    dbc.Button("Run AI Prediction", id="run-ai", color="primary", style={"display": "none"}),
+                ], width=3)
+            ])
+        ])
+    ])
+
+@functools.lru_cache(maxsize=4)
+def _history_figure(key):
+    # key is (buffer fill, last timestamp), so tab switches between ticks
+    # reuse the cached figure instead of rescanning the history.
+    times, so2 = buffer_view()
+    return go.Figure(
+        data=[go.Scattergl(x=times, y=so2, mode="lines")],
+        layout=go.Layout(title="SO₂ Historical Data", paper_bgcolor="black", font={"color": "white"})
+    )
+
+def history_tab():
+    return dbc.Card([
+        dbc.CardHeader("Historical Trends and Report"),
+        dbc.CardBody([
+            dcc.Graph(id="history-chart",
+                      figure=_history_figure((len(_buf), _buf[-1][0]))),
+            dbc.Button("Export PDF Report", id="export-pdf", color="warning")
+        ])
+    ])
+
+# App Layout
+app.layout = dbc.Container([
+    html.H2("SO₂ Gas Monitoring Dashboard", className="text-center my-4"),
+    dcc.Tabs(id="tabs", value="settings", children=[
+        dcc.Tab(label="Sensor Settings", value="settings"),
+        dcc.Tab(label="Live Control Chart", value="live"),
+        dcc.Tab(label="Historical Trends", value="history"),
+    ], className="mb-3"),
+    html.Div(id="tab-content"),
+    dcc.Interval(id="interval", interval=5000, n_intervals=0)  # Every 5 seconds
+], fluid=True)
+
+# Tab Switcher
+@app.callback(Output("tab-content", "children"), Input("tabs", "value"))
+def switch_tabs(tab):
+    if tab == "settings":
+        return sensor_settings_tab()
+    elif tab == "live":
+        return live_chart_tab()
+    elif tab == "history":
+        return history_tab()
+
+# Update Sensor Settings
+@app.callback(
+    Output("lsl", "value"), Output("lcl", "value"),
+    Output("ucl", "value"), Output("usl", "value"),
+    Input("update-settings", "n_clicks"),
+    State("lsl", "value"), State("lcl", "value"),
+    State("ucl", "value"), State("usl", "value")
+)
+def update_settings(n, lsl, lcl, ucl, usl):
+    global _BASE_FIG
+    if n:
+        sensor_limits["SO2"] = {"lsl": lsl, "lcl": lcl, "ucl": ucl, "usl": usl}
+        _BASE_FIG = _make_base_figure()
+    return lsl, lcl, ucl, usl
+
+# Live Tab Updates — chart delta, AI prediction and current reading in one
+# callback, so each tick costs one round-trip instead of three. Runs inline
+# (not background) because it is a single deque append plus a table lookup,
+# and the deque must stay in the server process.
+@app.callback(
+    Output("live-chart", "extendData"),
+    Output("ai-status", "children"),
+    Output("ai-indicator", "color"),
+    Output("ai-indicator", "value"),
+    Output("current-so2", "children"),
+    Input("interval", "n_intervals")
+)
+def update_live_tab(n):
+    # Simulate new data: a bounded-deque append, atomic under the GIL
+    new_time = datetime.now()
+    new_so2 = float(500 + random.randint(-100, 150))
+    _buf.append((new_time, new_so2))
+
+    refresh_latest()
+
+    # Ship only the new point; the browser extends trace 0 and keeps the
+    # window at WINDOW points. The hlines stay in the initial figure.
+    extend = [dict(x=[[new_time]], y=[[new_so2]]), [0], WINDOW]
+    return (extend, LatestReading.status, LatestReading.color, True,
+            f"{LatestReading.so2:.1f} ppm")
+
+if __name__ == "__main__":
+    app.run_server(debug=True, port=8050)